@@ -1,23 +1,170 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
+import json
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
+import lxml.etree
+import lxml.html
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, NavigableString
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from datetime import timedelta, date
 from dateutil import parser
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+# Playwright: resource types we never parse, aborted to save network time.
+# Stylesheets must load: innerText depends on CSS (hidden blocks, text-transform).
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Twinsbet Arena
+_TWINSBET_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TWINSBET_TIME_RE = re.compile(r"\d{1,2}:\d{2}")
+
+# Šiaulių Arena
+# first date, plus the first time on its line (t0, before the date, or t after it),
+# else the first time within the next four lines
+_SIAULIU_DATETIME_RE = re.compile(
+    r"(?:(?P<t0>\b\d{1,2}:\d{2}\b)[^\n]*?)?"
+    r"(?P<d>\d{4}-\d{2}-\d{2})(?:(?:[^\n]*\n){0,4}?[^\n]*?\b(?P<t>\d{1,2}:\d{2})\b)?"
+)
+
+# Kalnapilio Arena
+_KALNAPILIO_MONTHS = {
+    "sausio": "01",
+    "vasario": "02",
+    "kovo": "03",
+    "balandžio": "04",
+    "gegužės": "05",
+    "birželio": "06",
+    "liepos": "07",
+    "rugpjūčio": "08",
+    "rugsėjo": "09",
+    "spalio": "10",
+    "lapkričio": "11",
+    "gruodžio": "12",
+}
+_KALNAPILIO_DT_RE = re.compile(r"(\d{4})\s+([^\s]+)\s+(\d{1,2})\s+d\.\s+(\d{1,2}:\d{2})", re.IGNORECASE)
+
+# Švyturio Arena: "2026 07 18 / 09:00"
+_SVYTURIO_DATE_RE = re.compile(r"(\d{4})\s+(\d{2})\s+(\d{2})")
+_SVYTURIO_TIME_RE = re.compile(r"\b(\d{1,2}:\d{2})\b")
+_SVYTURIO_EVENT_HREF_RE = re.compile(r"/events/")
+
+# Compensa
+_COMPENSA_TITLE_SUFFIX_RE = re.compile(r"\s*\|\s*Compensa.*$", re.I)
+_COMPENSA_DATE_RE = re.compile(r"Renginio data\s+(\d{4}-\d{2}-\d{2})", re.S)
+_COMPENSA_TIME_RE = re.compile(r"Renginio pradžia\s+(\d{1,2}:\d{2})", re.S)
+_COMPENSA_DATETIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\s+(\d{1,2}:\d{2})")
+_COMPENSA_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_COMPENSA_TICKET_HOSTS = ("bilietai.lt", "kakava.lt", "manobilietas.lt", "ticketshop", "medusa")
+_COMPENSA_TICKET_LABELS = {"bilietai", "pirkti bilietą", "pirkti bilieta"}
+_COMPENSA_TICKET_LABEL_PREFIXES = ("bilietai", "pirkti")
+
+# Žalgirio Arena
+_ZALGIRIO_DATE_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})\s*$")
+_ZALGIRIO_TIME_RE = re.compile(r"^\s*(\d{1,2}:\d{2})\s*$")
+_ZALGIRIO_BAD_TITLE_PREFIX_RE = re.compile(
+    r"^(?:Duration:|Doors open|Organizer:|From |Photography|Only allowed|Children|Free admission"
+    r"|No free admission|New AUDI club members|Audi club members|Nuo |Vaikai|Neįgalieji)"
+)
+_ZALGIRIO_TICKET_HOSTS = ("koobin", "kakava", "bilietai", "ticketshop", "manobilietas")
+_ZALGIRIO_LOCATIONS = {"Zalgirio Arena", "SDG amphitheatre", "Outside", "Foyer"}
+_ZALGIRIO_CATEGORIES = {
+    "Concert",
+    "Conference",
+    "EuroLeague",
+    "Exhibition",
+    "Fair",
+    "LKL/KMT",
+    "Other",
+    "Performance",
+    "Sport",
+    "Stand-up",
+}
+
+# Litexpo
+_LITEXPO_LT_MONTHS = {
+    "sausio": "January",
+    "vasario": "February",
+    "kovo": "March",
+    "balandžio": "April",
+    "gegužės": "May",
+    "birželio": "June",
+    "liepos": "July",
+    "rugpjūčio": "August",
+    "rugsėjo": "September",
+    "spalio": "October",
+    "lapkričio": "November",
+    "gruodžio": "December",
+}
+_LITEXPO_LT_MONTH_RE = re.compile("|".join(_LITEXPO_LT_MONTHS), re.IGNORECASE)
+
+
 def save_df(df: pd.DataFrame, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+
+    if pa is not None:
+        # build the whole file in memory so a failed write never truncates the old CSV
+        buf = io.BytesIO()
+        buf.write(b"\xef\xbb\xbf")  # utf-8-sig BOM, same as the pandas path
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, buf)
+        except pa.ArrowException:
+            pass
+        else:
+            path.write_bytes(buf.getvalue())
+            return
+
     df.to_csv(path, index=False, encoding="utf-8-sig")
 
 
+def load_json(content: bytes):
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def xpath_hrefs(content: bytes, xpath: str, encoding: str = "utf-8") -> list[str]:
+    # explicit encoding: without <meta charset> libxml2 would guess latin-1
+    try:
+        html_parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        html_parser = lxml.html.HTMLParser(encoding="utf-8")
+
+    # empty bodies and undecodable documents yield no links, like BeautifulSoup did
+    try:
+        tree = lxml.html.fromstring(content, parser=html_parser)
+    except (lxml.etree.ParserError, ValueError):
+        return []
+    return tree.xpath(xpath)
+
+
+# pass plain str: a cached NavigableString would keep its whole soup alive
+@functools.lru_cache(maxsize=4096)
+def _nfc_norm(text: str) -> str:
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
 def report_rows(df_name: str, df: pd.DataFrame) -> None:
     print(f"{df_name}: {len(df)} rows")
 
@@ -71,7 +218,7 @@ def scrape_bilietai_lt_api(max_pages: int = 6) -> pd.DataFrame:
                 params.append(("venues", v))
 
             r = requests.get(BASE_URL, params=params, headers=HEADERS)
-            data = r.json()
+            data = load_json(r.content)
 
             page_items = data.get("items", [])
             print(f"Page {page}: {len(page_items)} events")
@@ -91,7 +238,7 @@ def scrape_bilietai_lt_api(max_pages: int = 6) -> pd.DataFrame:
         )
         if r.status_code != 200:
             return None
-        return r.json()
+        return load_json(r.content)
 
     rows = []
     items = get_event_list()
@@ -157,15 +304,33 @@ async def scrape_twinsbet() -> pd.DataFrame:
 
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
-        page = await browser.new_page()
+        context = await browser.new_context()
+
+        async def block_heavy_resources(route):
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", block_heavy_resources)
+        page = await context.new_page()
 
-        await page.goto(url, timeout=90000)
-        await page.wait_for_timeout(2000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        try:
+            await page.wait_for_selector("a[href*='/renginys/']", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
 
-        # scroll
+        # scroll until no more content gets appended
         for _ in range(10):
-            await page.mouse.wheel(0, 5000)
-            await page.wait_for_timeout(500)
+            prev_height = await page.evaluate("document.body.scrollHeight")
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_function(
+                    f"document.body.scrollHeight > {prev_height}", timeout=3000
+                )
+            except PlaywrightTimeoutError:
+                break
 
         links = await page.locator("a[href*='/renginys/']").evaluate_all(
             "els => els.map(e => e.href)"
@@ -175,21 +340,27 @@ async def scrape_twinsbet() -> pd.DataFrame:
 
         for link in links:
             try:
-                await page.goto(link, timeout=90000)
-                await page.wait_for_timeout(1000)
+                await page.goto(link, wait_until="domcontentloaded", timeout=30000)
             except:
                 continue
 
-            text = await page.locator("body").inner_text()
-
-            title = ""
             try:
-                title = await page.locator("h1").inner_text()
-            except:
+                await page.wait_for_selector("h1", timeout=10000)
+            except PlaywrightTimeoutError:
                 pass
 
-            date_match = re.search(r"\d{4}-\d{2}-\d{2}", text)
-            time_match = re.search(r"\d{1,2}:\d{2}", text)
+            # body text and heading in one round-trip
+            content = await page.evaluate(
+                """() => {
+                    const h1 = document.querySelector("h1");
+                    return {text: document.body.innerText, title: h1 ? h1.innerText : ""};
+                }"""
+            )
+            text = content["text"] or ""
+            title = content["title"] or ""
+
+            date_match = _TWINSBET_DATE_RE.search(text)
+            time_match = _TWINSBET_TIME_RE.search(text)
 
             rows.append({
                 "event_name": title.strip(),
@@ -218,37 +389,37 @@ def scrape_siauliuarena() -> pd.DataFrame:
     }
 
     def norm(text):
-        if not text:
-            return ""
-        text = " ".join(text.split())
-        return unicodedata.normalize("NFC", text)
+        return _nfc_norm(str(text)) if text else ""
 
-    resp = requests.get(list_url, headers=headers, timeout=30)
-    resp.raise_for_status()
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
-    html = resp.content.decode("utf-8", errors="replace")
-    soup = BeautifulSoup(html, "lxml")
+    def fetch_event_page(url: str) -> requests.Response | None:
+        try:
+            r = session.get(url, timeout=30)
+            r.raise_for_status()
+        except Exception:
+            return None
+        return r
+
+    resp = session.get(list_url, timeout=30)
+    resp.raise_for_status()
 
     event_urls = set()
-    for a in soup.select("a[href*='/event/']"):
-        href = a.get("href")
-        if not href:
-            continue
+    for href in xpath_hrefs(resp.content, "//a[contains(@href, '/event/')]/@href"):
         url = urljoin(base_url, href.split("?")[0].split("#")[0])
         event_urls.add(url)
 
     event_urls = sorted(event_urls)
 
-    date_re = re.compile(r"\d{4}-\d{2}-\d{2}")
-    time_re = re.compile(r"\b\d{1,2}:\d{2}\b")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(fetch_event_page, event_urls))
 
     records: list[dict] = []
 
-    for url in event_urls:
-        try:
-            r = requests.get(url, headers=headers, timeout=30)
-            r.raise_for_status()
-        except Exception:
+    for url, r in zip(event_urls, responses):
+        if r is None:
             continue
 
         html_evt = r.content.decode("utf-8", errors="replace")
@@ -260,27 +431,14 @@ def scrape_siauliuarena() -> pd.DataFrame:
             event_name = norm(soup_evt.title.get_text())
 
         text = soup_evt.get_text("\n", strip=True)
-        lines = [l for l in text.split("\n") if l.strip()]
 
         date_str = ""
         time_str = ""
 
-        for idx, line in enumerate(lines):
-            m_date = date_re.search(line)
-            if not m_date:
-                continue
-
-            date_str = m_date.group(0)
-            m_time = time_re.search(line)
-            if m_time:
-                time_str = m_time.group(0)
-            else:
-                for j in range(idx + 1, min(idx + 5, len(lines))):
-                    m_time2 = time_re.search(lines[j])
-                    if m_time2:
-                        time_str = m_time2.group(0)
-                        break
-            break
+        m = _SIAULIU_DATETIME_RE.search(text)
+        if m:
+            date_str = m.group("d")
+            time_str = m.group("t0") or m.group("t") or ""
 
         if not event_name:
             continue
@@ -309,24 +467,7 @@ def scrape_kalnapilioarena() -> pd.DataFrame:
     headers = {"User-Agent": "Mozilla/5.0 Chrome/120.0"}
 
     def norm(text):
-        return unicodedata.normalize("NFC", " ".join(text.split())) if text else ""
-
-    lt_months = {
-        "sausio": "01",
-        "vasario": "02",
-        "kovo": "03",
-        "balandžio": "04",
-        "gegužės": "05",
-        "birželio": "06",
-        "liepos": "07",
-        "rugpjūčio": "08",
-        "rugsėjo": "09",
-        "spalio": "10",
-        "lapkričio": "11",
-        "gruodžio": "12",
-    }
-
-    dt_re = re.compile(r"(\d{4})\s+([^\s]+)\s+(\d{1,2})\s+d\.\s+(\d{1,2}:\d{2})", re.IGNORECASE)
+        return _nfc_norm(str(text)) if text else ""
 
     resp = requests.get(url, headers=headers, timeout=30)
     resp.raise_for_status()
@@ -334,17 +475,26 @@ def scrape_kalnapilioarena() -> pd.DataFrame:
     soup = BeautifulSoup(resp.content, "lxml")
     events: list[dict] = []
 
-    for node in soup.find_all(string=dt_re):
-        m = dt_re.search(norm(node))
+    # single document-order pass: the last <a> seen is what find_previous("a") would return
+    last_a = None
+    for node in soup.descendants:
+        if not isinstance(node, NavigableString):
+            if node.name == "a":
+                last_a = node
+            continue
+
+        if not _KALNAPILIO_DT_RE.search(node):
+            continue
+        m = _KALNAPILIO_DT_RE.search(norm(node))
         if not m:
             continue
 
         year, month_word, day, time = m.groups()
-        month = lt_months.get(month_word.lower())
+        month = _KALNAPILIO_MONTHS.get(month_word.lower())
         if not month:
             continue
 
-        a_tag = node.find_previous("a")
+        a_tag = last_a
         if not a_tag:
             continue
 
@@ -382,31 +532,25 @@ def scrape_svyturioarena() -> pd.DataFrame:
     }
 
     def norm(text):
-        if not text:
-            return ""
-        return unicodedata.normalize("NFC", " ".join(text.split()))
+        return _nfc_norm(str(text)) if text else ""
 
     resp = requests.get(url, headers=headers, timeout=30)
     resp.raise_for_status()
 
     soup = BeautifulSoup(resp.content.decode("utf-8", errors="replace"), "lxml")
 
-    # "2026 07 18 / 09:00"
-    date_re = re.compile(r"(\d{4})\s+(\d{2})\s+(\d{2})")
-    time_re = re.compile(r"\b(\d{1,2}:\d{2})\b")
-
     events: list[dict] = []
 
     for card in soup.select("div.events-item"):
         # date + time
         date_tag = card.select_one("div.date-text")
         raw_date = date_tag.get_text(" ", strip=True) if date_tag else ""
-        m = date_re.search(raw_date)
+        m = _SVYTURIO_DATE_RE.search(raw_date)
         if not m:
             continue
         year, month, day = m.groups()
         date_str = f"{year}-{month}-{day}"
-        m2 = time_re.search(raw_date[m.end():])
+        m2 = _SVYTURIO_TIME_RE.search(raw_date[m.end():])
         time_str = m2.group(1) if m2 else ""
 
         # title: first text node in div.text, ignoring "Plačiau"
@@ -423,7 +567,7 @@ def scrape_svyturioarena() -> pd.DataFrame:
             continue
 
         # event link
-        a = card.find("a", href=re.compile(r"/events/"))
+        a = card.find("a", href=_SVYTURIO_EVENT_HREF_RE)
         event_link = a["href"] if a else ""
 
         events.append({
@@ -456,13 +600,11 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
     }
 
     def norm(text):
-        if not text:
-            return ""
-        text = " ".join(text.split())
-        return unicodedata.normalize("NFC", text)
+        return _nfc_norm(str(text)) if text else ""
 
     session = requests.Session()
     session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
     def collect_listing_links(page_url: str) -> list[str]:
         try:
@@ -472,12 +614,12 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
             print(f"[listing failed] {page_url}: {e}")
             return []
 
-        soup = BeautifulSoup(resp.text, "lxml")
         links: list[str] = []
         seen: set[str] = set()
 
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
+        encoding = resp.encoding or resp.apparent_encoding
+        for href in xpath_hrefs(resp.content, "//a/@href", encoding):
+            href = href.strip()
             if not href:
                 continue
 
@@ -512,21 +654,21 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
 
         if not title and soup.title:
             title = norm(soup.title.get_text(" ", strip=True))
-            title = re.sub(r"\s*\|\s*Compensa.*$", "", title, flags=re.I).strip()
+            title = _COMPENSA_TITLE_SUFFIX_RE.sub("", title).strip()
 
         date_str = ""
         time_str = ""
 
-        m_date = re.search(r"Renginio data\s+(\d{4}-\d{2}-\d{2})", text, re.S)
+        m_date = _COMPENSA_DATE_RE.search(text)
         if m_date:
             date_str = m_date.group(1)
 
-        m_time = re.search(r"Renginio pradžia\s+(\d{1,2}:\d{2})", text, re.S)
+        m_time = _COMPENSA_TIME_RE.search(text)
         if m_time:
             time_str = m_time.group(1)
 
         if not date_str or not time_str:
-            m_dt = re.search(r"(\d{4}-\d{2}-\d{2})\s+(\d{1,2}:\d{2})", text)
+            m_dt = _COMPENSA_DATETIME_RE.search(text)
             if m_dt:
                 date_str = date_str or m_dt.group(1)
                 time_str = time_str or m_dt.group(2)
@@ -537,21 +679,20 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
         ticket_link = ""
         for a in soup.find_all("a", href=True):
             href = (a.get("href") or "").strip()
-            label = norm(a.get_text(" ", strip=True)).lower()
 
-            if label in {"bilietai", "pirkti bilietą", "pirkti bilieta"}:
-                ticket_link = urljoin(BASE_URL, href)
-                break
+            # every ticket label starts with an ASCII word, so only those anchors get normalized
+            raw_label = a.get_text(" ", strip=True)
+            if raw_label.lower().startswith(_COMPENSA_TICKET_LABEL_PREFIXES):
+                if norm(raw_label).lower() in _COMPENSA_TICKET_LABELS:
+                    ticket_link = urljoin(BASE_URL, href)
+                    break
 
-            if any(
-                x in href.lower()
-                for x in ["bilietai.lt", "kakava.lt", "manobilietas.lt", "ticketshop", "medusa"]
-            ):
+            if any(x in href.lower() for x in _COMPENSA_TICKET_HOSTS):
                 ticket_link = urljoin(BASE_URL, href)
                 break
 
         if not ticket_link:
-            m = re.search(r"https?://\S+|www\.\S+", text)
+            m = _COMPENSA_URL_RE.search(text)
             if m:
                 ticket_link = m.group(0).rstrip(").,;]")
                 if ticket_link.startswith("www."):
@@ -577,11 +718,9 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
 
     print(f"Collected {len(seen_event_urls)} event URLs")
 
-    rows: list[dict] = []
-    for event_url in sorted(seen_event_urls):
-        record = parse_event_page(event_url)
-        if record:
-            rows.append(record)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        records = executor.map(parse_event_page, sorted(seen_event_urls))
+        rows: list[dict] = [record for record in records if record]
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -595,6 +734,22 @@ def scrape_compensa(max_list_pages: int = 6) -> pd.DataFrame:
 
 
 # Žalgirio Arena
+@functools.lru_cache(maxsize=2048)
+def _zalgirio_is_valid_title(text: str) -> bool:
+    text = _nfc_norm(text)
+    if not text:
+        return False
+    if text in _ZALGIRIO_LOCATIONS or text in _ZALGIRIO_CATEGORIES:
+        return False
+    if text in ("Buy ticket", "Information"):
+        return False
+    if _ZALGIRIO_BAD_TITLE_PREFIX_RE.match(text):
+        return False
+    if len(text) > 120:
+        return False
+    return True
+
+
 def scrape_zalgirioarena() -> pd.DataFrame:
     url = "https://www.zalgirioarena.lt/en/events"
 
@@ -607,10 +762,7 @@ def scrape_zalgirioarena() -> pd.DataFrame:
     }
 
     def norm(text):
-        if not text:
-            return ""
-        text = " ".join(text.split())
-        return unicodedata.normalize("NFC", text)
+        return _nfc_norm(str(text)) if text else ""
 
     resp = requests.get(url, headers=headers, timeout=30)
     resp.raise_for_status()
@@ -618,87 +770,47 @@ def scrape_zalgirioarena() -> pd.DataFrame:
     html = resp.content.decode("utf-8", errors="replace")
     soup = BeautifulSoup(html, "lxml")
 
-    date_re = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})\s*$")
-    time_re = re.compile(r"^\s*(\d{1,2}:\d{2})\s*$")
-
-    locations = {"Zalgirio Arena", "SDG amphitheatre", "Outside", "Foyer"}
-    categories = {
-        "Concert",
-        "Conference",
-        "EuroLeague",
-        "Exhibition",
-        "Fair",
-        "LKL/KMT",
-        "Other",
-        "Performance",
-        "Sport",
-        "Stand-up",
-    }
+    # all text nodes in document order, scanned by index instead of repeated find_next() walks
+    strings = soup.find_all(string=True)
 
-    def is_valid_title(text: str) -> bool:
-        text = norm(text)
-        if not text:
-            return False
-        if text in locations or text in categories:
-            return False
-        if text in ("Buy ticket", "Information"):
-            return False
-
-        bad_prefixes = (
-            "Duration:",
-            "Doors open",
-            "Organizer:",
-            "From ",
-            "Photography",
-            "Only allowed",
-            "Children",
-            "Free admission",
-            "No free admission",
-            "New AUDI club members",
-            "Audi club members",
-            "Nuo ",
-            "Vaikai",
-            "Neįgalieji",
-        )
-        if any(text.startswith(p) for p in bad_prefixes):
-            return False
-        if len(text) > 120:
-            return False
-        return True
+    def find_next_index(start: int, predicate) -> int | None:
+        for i in range(start, len(strings)):
+            if predicate(strings[i]):
+                return i
+        return None
 
     events: list[dict] = []
 
-    for date_node in soup.find_all(string=date_re):
-        m_date = date_re.match(date_node.strip())
+    for date_idx, date_node in enumerate(strings):
+        m_date = _ZALGIRIO_DATE_RE.match(date_node)
         if not m_date:
             continue
         date_str = m_date.group(1)
 
-        time_node = date_node.find_next(string=time_re)
-        if not time_node:
+        time_idx = find_next_index(date_idx + 1, _ZALGIRIO_TIME_RE.search)
+        if time_idx is None:
             continue
-        time_str = time_node.strip()
+        time_str = strings[time_idx].strip()
 
-        loc_node = time_node.find_next(string=lambda s: s and s.strip() in locations)
-        if not loc_node:
+        loc_idx = find_next_index(time_idx + 1, lambda s: s.strip() in _ZALGIRIO_LOCATIONS)
+        if loc_idx is None:
             continue
-        location = norm(loc_node)
+        location = norm(strings[loc_idx])
 
-        cat_node = loc_node.find_next(string=lambda s: s and s.strip() in categories)
-        if not cat_node:
+        cat_idx = find_next_index(loc_idx + 1, lambda s: s.strip() in _ZALGIRIO_CATEGORIES)
+        if cat_idx is None:
             continue
 
         title = None
-        for el in cat_node.next_elements:
-            if isinstance(el, NavigableString):
-                txt = el.strip()
-                if not txt:
-                    continue
-                if txt in ("Buy ticket", "Information"):
-                    break
-                if is_valid_title(txt):
-                    title = norm(txt)
-                    break
+        for i in range(cat_idx + 1, len(strings)):
+            txt = strings[i].strip()
+            if not txt:
+                continue
+            if txt in ("Buy ticket", "Information"):
+                break
+            if _zalgirio_is_valid_title(txt):
+                title = norm(txt)
+                break
 
         if not title:
             continue
@@ -711,22 +823,20 @@ def scrape_zalgirioarena() -> pd.DataFrame:
         )
 
         if event_container:
+            # "Buy ticket" wins; otherwise the first link to a known ticket seller
+            ticket_host_href = ""
             for a in event_container.find_all("a", href=True):
                 href = (a.get("href") or "").strip()
-                label = a.get_text(" ", strip=True).lower()
-                if label == "buy ticket" and href and href != "#":
+                if not href or href == "#":
+                    continue
+                if a.get_text(" ", strip=True).lower() == "buy ticket":
                     event_link = requests.compat.urljoin(url, href)
                     break
+                if not ticket_host_href and any(x in href.lower() for x in _ZALGIRIO_TICKET_HOSTS):
+                    ticket_host_href = href
 
-            if not event_link:
-                for a in event_container.find_all("a", href=True):
-                    href = (a.get("href") or "").strip()
-                    if not href or href == "#":
-                        continue
-                    href_l = href.lower()
-                    if any(x in href_l for x in ["koobin", "kakava", "bilietai", "ticketshop", "manobilietas"]):
-                        event_link = requests.compat.urljoin(url, href)
-                        break
+            if not event_link and ticket_host_href:
+                event_link = requests.compat.urljoin(url, ticket_host_href)
 
         events.append(
             {
@@ -789,11 +899,19 @@ def scrape_kulturosuostas_festivaliai(months_forward: int = 6) -> pd.DataFrame:
         except ValueError:
             return None
 
-    def smallest_container_with_single_h4(h4):
+    def count_h4_per_ancestor(soup) -> dict[int, int]:
+        # one pass over the <h4>s instead of a find_all("h4") rescan per ancestor
+        counts: dict[int, int] = {}
+        for h4 in soup.find_all("h4"):
+            for parent in h4.parents:
+                counts[id(parent)] = counts.get(id(parent), 0) + 1
+        return counts
+
+    def smallest_container_with_single_h4(h4, h4_counts: dict[int, int]):
         node = h4
         while node and getattr(node, "name", None) not in ("body", "html"):
             if getattr(node, "name", None) in ("div", "li", "article", "section"):
-                if len(node.find_all("h4")) == 1:
+                if h4_counts.get(id(node), 0) == 1:
                     return node
             node = node.parent
         return h4.parent
@@ -859,7 +977,8 @@ def scrape_kulturosuostas_festivaliai(months_forward: int = 6) -> pd.DataFrame:
         r = session.post(AJAX_URL, data=payload, timeout=20)
         r.raise_for_status()
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.text, "lxml")
+        h4_counts = count_h4_per_ancestor(soup)
         current_day = None
 
         for el in soup.find_all(["h3", "h4"]):
@@ -887,7 +1006,7 @@ def scrape_kulturosuostas_festivaliai(months_forward: int = 6) -> pd.DataFrame:
             if event_dt.date() < today.date():
                 continue
 
-            container = smallest_container_with_single_h4(el)
+            container = smallest_container_with_single_h4(el, h4_counts)
             time_text, venue_text = extract_time_and_venue(container, event_name)
 
             if venue_text and is_month_header(venue_text):
@@ -927,24 +1046,8 @@ def parse_dates(raw_date: str):
     s = s.replace("Nowember", "November")
     s = s.replace("Murch", "March")
 
-    # Lithuanian → English
-    lt_months = {
-        "sausio": "January",
-        "vasario": "February",
-        "kovo": "March",
-        "balandžio": "April",
-        "gegužės": "May",
-        "birželio": "June",
-        "liepos": "July",
-        "rugpjūčio": "August",
-        "rugsėjo": "September",
-        "spalio": "October",
-        "lapkričio": "November",
-        "gruodžio": "December",
-    }
-
-    for lt, en in lt_months.items():
-        s = re.sub(lt, en, s, flags=re.IGNORECASE)
+    # Lithuanian → English, all months in one pass
+    s = _LITEXPO_LT_MONTH_RE.sub(lambda m: _LITEXPO_LT_MONTHS.get(m.group(0).casefold(), m.group(0)), s)
 
     # clean
     s = re.sub(r"\bof\b", "", s)
@@ -1059,59 +1162,49 @@ def scrape_litexpo() -> pd.DataFrame:
 async def main() -> None:
     out_dir = Path("output")
 
-    # Bilietai.lt
-    df_bilietai_lt = scrape_bilietai_lt_api(max_pages=6)
-    report_rows("df_bilietai_lt", df_bilietai_lt)
-    save_df(df_bilietai_lt, out_dir / "df_bilietai_lt.csv")
-    report_saved(out_dir / "df_bilietai_lt.csv")
-
-    # Twinsbet Arena
-    df_twinsbet = await scrape_twinsbet()
-    report_rows("df_twinsbet", df_twinsbet)
-    save_df(df_twinsbet, out_dir / "df_twinsbet.csv")
-    report_saved(out_dir / "df_twinsbet.csv")
-
-    # Šiaulių Arena
-    df_siauliuarena = scrape_siauliuarena()
-    report_rows("df_siauliuarena", df_siauliuarena)
-    save_df(df_siauliuarena, out_dir / "df_siauliuarena.csv")
-    report_saved(out_dir / "df_siauliuarena.csv")
-
-    # Kalnapilio Arena
-    df_kalnapilioarena = scrape_kalnapilioarena()
-    report_rows("df_kalnapilioarena", df_kalnapilioarena)
-    save_df(df_kalnapilioarena, out_dir / "df_kalnapilioarena.csv")
-    report_saved(out_dir / "df_kalnapilioarena.csv")
-
-    # Švyturio Arena
-    df_svyturioarena = scrape_svyturioarena()
-    report_rows("df_svyturioarena", df_svyturioarena)
-    save_df(df_svyturioarena, out_dir / "df_svyturioarena.csv")
-    report_saved(out_dir / "df_svyturioarena.csv")
-
-    # Compensa
-    df_compensa = scrape_compensa(max_list_pages=6)
-    report_rows("df_compensa", df_compensa)
-    save_df(df_compensa, out_dir / "df_compensa.csv")
-    report_saved(out_dir / "df_compensa.csv")
-
-    # Žalgirio Arena
-    df_zalgirioarena = scrape_zalgirioarena()
-    report_rows("df_zalgirioarena", df_zalgirioarena)
-    save_df(df_zalgirioarena, out_dir / "df_zalgirioarena.csv")
-    report_saved(out_dir / "df_zalgirioarena.csv")
-
-    # Kultūros uostas - Klaipedos miesto renginiai
-    df_klaipeda = scrape_kulturosuostas_festivaliai()
-    report_rows("df_klaipeda", df_klaipeda)
-    save_df(df_klaipeda, out_dir / "df_klaipeda.csv")
-    report_saved(out_dir / "df_klaipeda.csv")
-
-    # Litexpo
-    df_litexpo = scrape_litexpo()
-    report_rows("df_litexpo", df_litexpo)
-    save_df(df_litexpo, out_dir / "df_litexpo.csv")
-    report_saved(out_dir / "df_litexpo.csv")
+    # the scrapers hit different hosts and share no state, so run them side by side
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=8))
+
+    scrapers = [
+        # Bilietai.lt
+        ("df_bilietai_lt", asyncio.to_thread(scrape_bilietai_lt_api, max_pages=6)),
+        # Twinsbet Arena
+        ("df_twinsbet", scrape_twinsbet()),
+        # Šiaulių Arena
+        ("df_siauliuarena", asyncio.to_thread(scrape_siauliuarena)),
+        # Kalnapilio Arena
+        ("df_kalnapilioarena", asyncio.to_thread(scrape_kalnapilioarena)),
+        # Švyturio Arena
+        ("df_svyturioarena", asyncio.to_thread(scrape_svyturioarena)),
+        # Compensa
+        ("df_compensa", asyncio.to_thread(scrape_compensa, max_list_pages=6)),
+        # Žalgirio Arena
+        ("df_zalgirioarena", asyncio.to_thread(scrape_zalgirioarena)),
+        # Kultūros uostas - Klaipedos miesto renginiai
+        ("df_klaipeda", asyncio.to_thread(scrape_kulturosuostas_festivaliai)),
+        # Litexpo
+        ("df_litexpo", asyncio.to_thread(scrape_litexpo)),
+    ]
+
+    # one failing site must not keep the other CSVs from being saved
+    results = await asyncio.gather(*(job for _, job in scrapers), return_exceptions=True)
+
+    failed: list[str] = []
+    for (df_name, _), df in zip(scrapers, results):
+        # BaseException: gather() also returns CancelledError, which is not an Exception
+        if isinstance(df, BaseException):
+            # ::error:: annotates the GitHub Actions run
+            print(f"::error::[scraper failed] {df_name}: {df!r}")
+            failed.append(df_name)
+            continue
+        path = out_dir / f"{df_name}.csv"
+        report_rows(df_name, df)
+        save_df(df, path)
+        report_saved(path)
+
+    # the successful CSVs are saved above; still fail the run so a broken site is noticed
+    if failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":